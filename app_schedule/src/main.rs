@@ -3,7 +3,7 @@ mod routing;
 
 use actix_web::{middleware, web::Data, App, HttpServer};
 use anyhow::Context;
-use common_actix::{define_app_error, get_address};
+use common_actix::{define_app_error, get_address, get_workers};
 use di::AppComponent;
 use domain_schedule::usecases::InitDomainScheduleUseCase;
 use feature_schedule::v1::FeatureSchedule;
@@ -35,6 +35,7 @@ async fn main() -> std::io::Result<()> {
             .service(routing::get_schedule_v1)
             .service(routing::search_schedule_v1)
     })
+    .workers(get_workers())
     .bind(get_address())?
     .run()
     .await
@@ -1,6 +1,6 @@
 use actix_web::{middleware, web::Data, App, HttpServer};
 use anyhow::Context;
-use common_actix::{define_app_error, get_address};
+use common_actix::{define_app_error, get_address, get_workers};
 use di::create_app;
 use domain_bot::usecases::InitDomainBotUseCase;
 use feature_vk_bot::FeatureVkBot;
@@ -33,6 +33,7 @@ async fn main() -> std::io::Result<()> {
             .service(routing::health)
             .service(routing::vk_callback_v1)
     })
+    .workers(get_workers())
     .bind(get_address())?
     .run()
     .await
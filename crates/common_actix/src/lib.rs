@@ -1,3 +1,5 @@
+use std::num::NonZeroUsize;
+
 use common_rust::env;
 use log::info;
 
@@ -18,6 +20,16 @@ pub fn get_address() -> (String, u16) {
     (host, port)
 }
 
+/// Get number of server workers from environment variable `WORKERS`.
+/// Default is the number of CPUs available to the process.
+pub fn get_workers() -> usize {
+    let workers = env::get_parsed::<NonZeroUsize>("WORKERS")
+        .or_else(|| std::thread::available_parallelism().ok())
+        .map_or(1, NonZeroUsize::get);
+    info!("Starting server with {} workers", workers);
+    workers
+}
+
 /// Create struct for app scope Error and implement all necessary standard
 /// and actix-web traits for further use as `Responder`.
 ///
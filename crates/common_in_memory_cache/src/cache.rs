@@ -158,23 +158,24 @@ impl<K: Eq + Hash, V> InMemoryCache<K, V> {
 
     /// For internal use only
     fn get_entry(&mut self, key: &K, keep_expired_value: bool) -> Option<(&'_ Entry<V>, bool)> {
-        let entry = self.entries.get(key);
+        // Peek first, so the expiration checks do not touch the LRU order
+        let entry = self.entries.peek(key)?;
         // Check 'created_at' expiration policy
-        let expired = match (self.expires_after_creation, &entry) {
-            (Some(ref duration), Some(entry)) => is_expired(&Some(entry.created_at), duration),
-            (_, _) => false,
+        let expired = match self.expires_after_creation {
+            Some(ref duration) => is_expired(&Some(entry.created_at), duration),
+            None => false,
         };
         // Check 'accessed_at' expiration policy
         let expired = expired
-            || match (self.expires_after_access, &entry) {
-                (Some(ref duration), Some(entry)) => is_expired(&Some(entry.accessed_at), duration),
-                (_, _) => false,
+            || match self.expires_after_access {
+                Some(ref duration) => is_expired(&Some(entry.accessed_at), duration),
+                None => false,
             };
         // Check 'max_hits' expiration policy
         let expired = expired
-            || match (self.max_hits, &entry) {
-                (Some(max_hits), Some(entry)) => max_hits <= entry.hits,
-                (_, _) => false,
+            || match self.max_hits {
+                Some(max_hits) => max_hits <= entry.hits,
+                None => false,
             };
 
         if !keep_expired_value && expired {
@@ -182,14 +183,11 @@ impl<K: Eq + Hash, V> InMemoryCache<K, V> {
             return None;
         }
 
-        // Modify last access date and hits number
-        if let Some(entry) = self.entries.get_mut(key) {
-            entry.accessed_at = Local::now();
-            entry.hits = entry.hits.saturating_add(1);
-        };
-
-        // Return entry
-        self.entries.get(key).map(|entry| (entry, expired))
+        // Modify last access date and hits number, then return entry
+        let entry = self.entries.get_mut(key)?;
+        entry.accessed_at = Local::now();
+        entry.hits = entry.hits.saturating_add(1);
+        Some((entry, expired))
     }
 
     /// Returns a bool indicating whether the given key is in the cache.
@@ -1,19 +1,18 @@
 use std::{
     fmt::Display,
+    io::ErrorKind,
     path::{Path, PathBuf},
 };
 
 use serde::{de::DeserializeOwned, Serialize};
-use tokio::{
-    fs::File,
-    io::{AsyncReadExt, AsyncWriteExt},
-};
+use tokio::{fs::File, io::AsyncWriteExt};
 
 /// # PersistentCache
 ///
 /// Persistent cache implementation based on storing records in files.
 /// This implementation also uses tokio runtime (with "fs" feature)
-/// to prevent reading files from blocking other tasks.
+/// to prevent reading files from blocking other tasks. For the same reason
+/// it never calls blocking [std::path::Path::exists] to check entries.
 ///
 /// Basically, [PersistentCache] is just wrapper around [tokio::fs::File] and its functions.
 /// You can use compound keys (separated by /) to store values. For example,
@@ -53,9 +52,8 @@ impl PersistentCache {
     {
         let cache_entry_path = self.cache_dir.join(key);
         if let Some(parent_dir_path) = cache_entry_path.parent() {
-            if !parent_dir_path.exists() {
-                tokio::fs::create_dir_all(parent_dir_path).await?;
-            }
+            // does nothing if directories already exist
+            tokio::fs::create_dir_all(parent_dir_path).await?;
         }
         let mut file = File::create(cache_entry_path).await?;
         let serialized_value =
@@ -66,24 +64,25 @@ impl PersistentCache {
 
     /// Get value from the cache
     ///
+    /// Returns `Ok(None)` if there is no entry for the `key`.
+    ///
     /// Returns `IOError` if an error occurs while working with the file system:
-    /// - [tokio::fs::File] (open)
-    /// - [tokio::io::util::AsyncReadExt::read_to_string]
+    /// - [tokio::fs::read]
     ///
-    /// Returns `DeserializationError` if [serde_json::from_str] cannot get its work done.
+    /// Returns `DeserializationError` if [serde_json::from_slice] cannot get its work done.
     pub async fn get<K, V>(&mut self, key: K) -> Result<Option<V>, Error>
     where
         K: AsRef<Path>,
         V: DeserializeOwned,
     {
         let cache_entry_path = self.cache_dir.join(key);
-        if !cache_entry_path.exists() {
-            return Ok(None);
-        }
-        let mut file = File::open(cache_entry_path).await?;
-        let mut serialized_value = String::with_capacity(8192);
-        file.read_to_string(&mut serialized_value).await?;
-        let deserialized_value: V = serde_json::from_str(&serialized_value)?;
+        // read the whole file at once into a buffer of the file size
+        let serialized_value = match tokio::fs::read(cache_entry_path).await {
+            Ok(bytes) => bytes,
+            Err(e) if e.kind() == ErrorKind::NotFound => return Ok(None),
+            Err(e) => return Err(e.into()),
+        };
+        let deserialized_value: V = serde_json::from_slice(&serialized_value)?;
         Ok(Some(deserialized_value))
     }
 }
@@ -158,9 +158,7 @@ fn render_time_prediction(time_prediction: &TimePrediction, buf: &mut String) {
             } else {
                 buf.push_str("Ближайшие пары ");
                 buf.push_str(render_day_of_week_gen(date.weekday()));
-                buf.push_str(", ");
-                buf.push_str(&date.day().to_string());
-                buf.push(' ');
+                write!(buf, ", {} ", date.day()).unwrap();
                 buf.push_str(render_month(date.month()));
             }
         }
@@ -208,9 +206,7 @@ fn render_day(
         } else {
             buf.push_str(render_day_of_week_gen(day.date.weekday()));
         }
-        buf.push_str(", ");
-        buf.push_str(&day.date.day().to_string());
-        buf.push(' ');
+        write!(buf, ", {} ", day.date.day()).unwrap();
         buf.push_str(render_month(day.date.month()));
         buf.push_str("\n\n");
     };
@@ -254,10 +250,13 @@ fn render_classes(cls: &Classes, schedule_type: &ScheduleType, buf: &mut String)
         buf.push_str(&cls.place);
         buf.push('\n');
     }
-    buf.push_str("🕖 С ");
-    buf.push_str(&cls.time.start.format("%H:%M").to_string());
-    buf.push_str(" до ");
-    buf.push_str(&cls.time.end.format("%H:%M").to_string());
+    write!(
+        buf,
+        "🕖 С {} до {}",
+        cls.time.start.format("%H:%M"),
+        cls.time.end.format("%H:%M")
+    )
+    .unwrap();
 }
 
 #[inline]
@@ -276,7 +276,12 @@ impl GenerateReplyUseCase {
             .search_schedule(q, None)
             .await
             .with_context(|| "Error while processing schedule change")?;
-        if let Some(candidate) = search_results.iter().find(|it| it.name.to_lowercase() == q) {
+        // lowercase each name only once, both for exact match lookup and for sorting
+        let mut results = search_results
+            .into_iter()
+            .map(|it| (it.name.to_lowercase(), it))
+            .collect::<Vec<_>>();
+        if let Some((_, candidate)) = results.iter().find(|(name, _)| name == q) {
             self.1
                 .save_peer(Peer {
                     selected_schedule: candidate.name.to_owned(),
@@ -288,25 +293,20 @@ impl GenerateReplyUseCase {
             Ok(Reply::ScheduleChangedSuccessfully(
                 candidate.name.to_owned(),
             ))
-        } else if !search_results.is_empty() {
-            let mut results = search_results;
+        } else if !results.is_empty() {
             let max_idx = results.len();
-            results.sort_by(|a, b| {
-                let idx_a = a.name.to_lowercase().find(q).or(Some(max_idx));
-                let idx_b = b.name.to_lowercase().find(q).or(Some(max_idx));
-                idx_a.cmp(&idx_b)
-            });
+            results.sort_by_cached_key(|(name, _)| name.find(q).unwrap_or(max_idx));
             let results_contains_person = results
                 .iter()
-                .any(|it| matches!(it.r#type, ScheduleType::Person));
+                .any(|(_, it)| matches!(it.r#type, ScheduleType::Person));
 
             Ok(Reply::ScheduleSearchResults {
                 schedule_name: q.to_owned(),
                 results_contains_person,
                 results: if results_contains_person {
-                    results.into_iter().take(3).map(|it| it.name).collect()
+                    results.into_iter().take(3).map(|(_, it)| it.name).collect()
                 } else {
-                    results.into_iter().take(6).map(|it| it.name).collect()
+                    results.into_iter().take(6).map(|(_, it)| it.name).collect()
                 },
             })
         } else {
@@ -336,20 +336,19 @@ pub struct GetUpcomingEventsUseCase(pub(crate) Arc<ScheduleRepository>);
 
 impl GetUpcomingEventsUseCase {
     pub async fn handle_upcoming_events(&self, peer: Peer) -> anyhow::Result<Reply> {
-        // load all days for current and next week
+        // load all days for current and next week, both requests are sent concurrently
+        let (current_week, next_week) = tokio::try_join!(
+            self.0
+                .get_schedule(&peer.selected_schedule, &peer.selected_schedule_type, 0),
+            self.0
+                .get_schedule(&peer.selected_schedule, &peer.selected_schedule_type, 1),
+        )?;
         let mut days: Vec<Day> = Vec::with_capacity(14);
-        self.0
-            .get_schedule(&peer.selected_schedule, &peer.selected_schedule_type, 0)
-            .await?
-            .weeks
-            .iter_mut()
-            .for_each(|week| days.append(&mut week.days));
-        self.0
-            .get_schedule(&peer.selected_schedule, &peer.selected_schedule_type, 1)
-            .await?
+        current_week
             .weeks
-            .iter_mut()
-            .for_each(|week| days.append(&mut week.days));
+            .into_iter()
+            .chain(next_week.weeks)
+            .for_each(|mut week| days.append(&mut week.days));
         // remove all past days, (and also current day if it has only past classes)
         let local_datetime = Local::now();
         let current_date = local_datetime.date_naive();
@@ -4,9 +4,7 @@ use common_in_memory_cache::InMemoryCache;
 use common_restix::ResultExt;
 use common_rust::env;
 use domain_schedule_models::ScheduleType;
-use lazy_static::lazy_static;
 use log::debug;
-use regex::Regex;
 use tokio::sync::Mutex;
 
 use crate::{
@@ -14,10 +12,6 @@ use crate::{
     mpei_api::MpeiApi,
 };
 
-lazy_static! {
-    static ref SPACES_PATTERN: Regex = Regex::new(r"\s{2,}").unwrap();
-}
-
 pub struct ScheduleIdRepository {
     api: MpeiApi,
     cache: Mutex<InMemoryCache<ScheduleName, ScheduleId>>,
@@ -101,12 +95,47 @@ impl ScheduleIdRepository {
             .with_common_error()?;
         Ok(search_results
             .into_iter()
-            .find(|result| self.fuzzy_equals(name.as_ref(), &result.label)))
+            .find(|result| fuzzy_equals(name.as_ref(), &result.label)))
     }
+}
+
+/// Compare two names case-insensitively, treating any run of two or more
+/// whitespaces as a single space.
+///
+/// Both strings are normalized lazily, so the comparison is done in a single pass
+/// without intermediate allocations and stops at the first mismatch.
+fn fuzzy_equals(a: &str, b: &str) -> bool {
+    fuzzy_chars(a).eq(fuzzy_chars(b))
+}
+
+fn fuzzy_chars(s: &str) -> impl Iterator<Item = char> + '_ {
+    let mut chars = s.chars().peekable();
+    std::iter::from_fn(move || {
+        let c = chars.next()?;
+        if c.is_whitespace() && chars.peek().map_or(false, |it| it.is_whitespace()) {
+            while chars.next_if(|it| it.is_whitespace()).is_some() {}
+            Some(' ')
+        } else {
+            Some(c)
+        }
+    })
+    .flat_map(char::to_lowercase)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::fuzzy_equals;
 
-    fn fuzzy_equals(&self, a: &str, b: &str) -> bool {
-        let clear_a = SPACES_PATTERN.replace_all(a, " ");
-        let clear_b = SPACES_PATTERN.replace_all(b, " ");
-        clear_a.to_lowercase() == clear_b.to_lowercase()
+    #[test]
+    fn test_fuzzy_equals() {
+        assert!(fuzzy_equals("С-12-16", "с-12-16"));
+        assert!(fuzzy_equals(
+            "Адамов  Борис   Игоревич",
+            "адамов борис игоревич"
+        ));
+        assert!(fuzzy_equals("Адамов\t\nБорис", "Адамов Борис"));
+        assert!(!fuzzy_equals("Адамов Борис", "Адамов Борис Игоревич"));
+        assert!(!fuzzy_equals("Адамов\tБорис", "Адамов Борис"));
+        assert!(!fuzzy_equals("АдамовБорис", "Адамов Борис"));
     }
 }
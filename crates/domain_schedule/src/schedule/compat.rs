@@ -60,8 +60,10 @@ mod datetime_serde {
         if let Some(s) = s {
             // for backward compatibility with Kotlin generated cache entries,
             // remove '[Europe/Moscow]' at the end
-            let s = s.chars().take_while(|it| it != &'[').collect::<String>();
-            let naive = NaiveDateTime::parse_from_str(&s, "%Y-%m-%dT%H:%M:%S%.f%z")
+            let s = s
+                .split_once('[')
+                .map_or(s.as_str(), |(datetime, _)| datetime);
+            let naive = NaiveDateTime::parse_from_str(s, "%Y-%m-%dT%H:%M:%S%.f%z")
                 .map_err(serde::de::Error::custom)?;
 
             // TODO: from_local_datetime always returns LocalResult::Single, but I need to get rid of unwrap()
@@ -38,22 +38,18 @@ pub(crate) fn map_schedule_models(
             number: get_number(&time),
             time,
         };
-        if !map_of_days.contains_key(&cls.date) {
-            map_of_days.insert(cls.date.to_owned(), vec![]);
-        }
-        if let Some(vec) = map_of_days.get_mut(&cls.date) {
-            vec.push(mpeix_cls)
-        };
+        map_of_days.entry(cls.date).or_default().push(mpeix_cls);
     }
-    let mut days = Vec::<Day>::new();
-    for (day_of_week, classes) in map_of_days {
-        days.push(Day {
+    let mut days = map_of_days
+        .into_iter()
+        .map(|(day_of_week, classes)| Day {
             day_of_week: day_of_week.weekday().number_from_monday() as u8,
             date: day_of_week,
             classes,
-        });
-    }
-    days.sort_by(|a, b| a.date.cmp(&b.date));
+        })
+        .collect::<Vec<Day>>();
+    // dates are unique keys of the map, so an unstable sort gives the same order
+    days.sort_unstable_by_key(|day| day.date);
     Schedule {
         id: schedule_id.to_string(),
         name: name.as_string(),
@@ -11,8 +11,11 @@ use tokio::sync::Mutex;
 use crate::time::{NaiveDateExt, WeekOfSemester};
 
 pub struct ScheduleShiftRepository {
-    cache: Mutex<InMemoryCache<(), ScheduleShift>>,
+    /// Cached shift from config file, `None` if config file does not exist
+    cache: Mutex<InMemoryCache<(), Option<ScheduleShift>>>,
     config_path: PathBuf,
+    /// Embedded shift config can't change at runtime, so we parse it only once
+    default_shift: ScheduleShift,
 }
 
 impl Default for ScheduleShiftRepository {
@@ -23,6 +26,10 @@ impl Default for ScheduleShiftRepository {
                 InMemoryCache::with_capacity(1).expires_after_creation(Duration::minutes(1)),
             ),
             config_path: config_path.into(),
+            default_shift: ScheduleShift::from_str(include_str!(
+                "../../../domain_schedule_shift/res/default_schedule_shift.toml"
+            ))
+            .expect("Default schedule shift config shall be valid"),
         }
     }
 }
@@ -35,25 +42,24 @@ impl ScheduleShiftRepository {
         debug!("Getting schedule shift...");
         let mut cache = self.cache.lock().await;
         if cache.get(&()).is_none() {
-            if self.config_path.exists() {
-                cache.insert(
-                    (),
+            let config_shift = if self.config_path.exists() {
+                Some(
                     ScheduleShift::from_file(&self.config_path)
                         .await
                         .with_context(|| "Cannot access shift config file")?,
-                );
+                )
             } else {
-                cache.insert(
-                    (),
-                    ScheduleShift::from_str(include_str!(
-                        "../../../domain_schedule_shift/res/default_schedule_shift.toml"
-                    ))?,
-                );
-            }
+                None
+            };
+            cache.insert((), config_shift);
         }
 
+        let shift = cache
+            .get(&())
+            .and_then(Option::as_ref)
+            .unwrap_or(&self.default_shift);
         week_start
-            .week_of_semester(cache.get(&()))
+            .week_of_semester(Some(shift))
             .ok_or_else(|| anyhow!("Cannot calculate week of semester for '{week_start}'"))
     }
 }
@@ -2,7 +2,6 @@ use std::{collections::HashMap, fmt::Display, path::Path, str::FromStr};
 
 use anyhow::{bail, ensure};
 use chrono::{Datelike, NaiveDate};
-use tokio::{fs::File, io::AsyncReadExt};
 use toml::Table;
 
 /// Structure, remembering exceptions to the rules in the numbering of academic weeks.
@@ -39,9 +38,7 @@ const SEMESTERS: &[ShiftedSemester] = &[ShiftedSemester::Spring, ShiftedSemester
 
 impl ScheduleShift {
     pub async fn from_file<P: AsRef<Path>>(path: P) -> anyhow::Result<Self> {
-        let mut file = File::open(path).await?;
-        let mut serialized_value = String::with_capacity(4096);
-        file.read_to_string(&mut serialized_value).await?;
+        let serialized_value = tokio::fs::read_to_string(path).await?;
         ScheduleShift::from_str(&serialized_value)
     }
 